@@ -1,54 +1,43 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import altair as alt
 import numpy as np
-from matplotlib.ticker import FuncFormatter
-
-# Tax configuration constants
-TAX_BRACKETS = {
-    'income': [(0, 11000), (11001, 44725), (44726, 95375), (95376, 182100), (182101, 231250), (231251, 578125), (578126, float('inf'))],
-    'fica': [(0, 160000)],
-    'capital_gains': [(0, 40000), (40001, 441450), (441451, float('inf'))]
-}
-
-TAX_RATES = {
-    'income': [0.10, 0.12, 0.22, 0.24, 0.32, 0.35, 0.37],
-    'fica': [0.0765],
-    'capital_gains': [0.0, 0.15, 0.20]
-}
-
-DEDUCTIONS = {
-    'income': 13850,
-    'fica': 0,
-    'capital_gains': 0
-}
-
-def calculate_tax(income, tax_type):
-    brackets = TAX_BRACKETS[tax_type]
-    rates = TAX_RATES[tax_type]
-    deduction = DEDUCTIONS[tax_type]
-    
-    tax = 0
-    taxable_income = max(0, income - deduction)
-    
-    for i in range(len(brackets)):
-        min_income, max_income = brackets[i]
-        rate = rates[i]
-        if taxable_income > min_income:
-            income_in_bracket = min(taxable_income, max_income) - min_income
-            tax += income_in_bracket * rate
-        else:
-            break
-    return tax
-
-def income_tax(income):
-    return calculate_tax(income, 'income')
-
-def fica_tax(income):
-    return calculate_tax(income, 'fica')
-
-def capital_gains_tax(income):
-    return calculate_tax(income, 'capital_gains')
+from tax_core import project
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _compute(age, life_expectancy, initial_salary, salary_growth, diminish_growth,
+             savings_rate, current_savings, interest_on_debt,
+             rate_of_return, withdrawal_rate, other_income):
+    ages = np.arange(age, life_expectancy, dtype=np.int32)
+    years = ages - (age - 1)
+
+    (salary, income_taxes, fica_taxes, total_tax, after_tax_income,
+     contributions, net_worth, spending, investment_income) = project(
+        age, life_expectancy, float(initial_salary), salary_growth, diminish_growth,
+        savings_rate, float(current_savings), rate_of_return, -interest_on_debt,
+        withdrawal_rate, float(other_income),
+    )
+
+    # Determine Financial Freedom Age
+    financial_freedom = ~np.signbit(investment_income - spending)
+    freedom_years = np.flatnonzero(financial_freedom)
+    first_ff_age = int(ages[freedom_years[0]]) if freedom_years.size else None
+
+    df = pd.DataFrame({
+        'Year': years,
+        'Age': ages,
+        'Salary': salary,
+        'Income Tax': income_taxes,
+        'FICA Tax': fica_taxes,
+        'Total Tax': total_tax,
+        'After-Tax Income': after_tax_income,
+        'Retirement Contribution': contributions,
+        'Net Worth': net_worth,
+        'Spending': spending,
+        'Investment Income': investment_income,
+        'Financial Freedom': financial_freedom,
+    }, copy=False)
+    return {'df': df, 'first_ff_age': first_ff_age}
 
 # Streamlit app title
 st.title("🌟 Retirement Planning Calculator")
@@ -79,41 +68,13 @@ withdrawal_rate = st.sidebar.slider("Withdrawal Rate During Retirement (%)", min
 other_income = st.sidebar.number_input("Other Retirement Income ($)", min_value=0, max_value=1_000_000, value=0, step=1_000)
 
 # Data Calculation
-career_length = life_expectancy - age
-df = pd.DataFrame({'Year': range(1, career_length + 1)})
-df['Age'] = df['Year'] + age - 1
-
-# Salary Projection
-if diminish_growth:
-    total_years = career_length
-    df['Salary'] = initial_salary * (1 + salary_growth * (1 - (df['Year'] - 1) / total_years))
-else:
-    df['Salary'] = initial_salary * ((1 + salary_growth) ** (df['Year'] - 1))
-
-# Tax Calculations
-df['Income Tax'] = df['Salary'].apply(income_tax)
-df['FICA Tax'] = df['Salary'].apply(fica_tax)
-df['Total Tax'] = df['Income Tax'] + df['FICA Tax']
-df['After-Tax Income'] = df['Salary'] - df['Total Tax']
-
-# Savings and Net Worth
-df['Retirement Contribution'] = df['After-Tax Income'] * savings_rate
-df['Net Worth'] = 0
-df.loc[0, 'Net Worth'] = current_savings + df.loc[0, 'Retirement Contribution']
-
-for i in range(1, len(df)):
-    previous_net_worth = df.loc[i - 1, 'Net Worth']
-    contribution = df.loc[i, 'Retirement Contribution']
-    growth_rate = rate_of_return if previous_net_worth >= 0 else -interest_on_debt
-    df.loc[i, 'Net Worth'] = previous_net_worth * (1 + growth_rate) + contribution
-
-df['Spending'] = df['After-Tax Income'] - df['Retirement Contribution']
-df['Investment Income'] = df['Net Worth'] * withdrawal_rate + other_income
-
-# Determine Financial Freedom Age
-difference = df['Investment Income'] - df['Spending']
-df['Financial Freedom'] = difference >= 0
-first_ff_age = df[df['Financial Freedom']].iloc[0]['Age'] if df['Financial Freedom'].any() else None
+results = _compute(
+    age, life_expectancy, initial_salary, salary_growth, diminish_growth,
+    savings_rate, current_savings, interest_on_debt,
+    rate_of_return, withdrawal_rate, other_income,
+)
+df = results['df']
+first_ff_age = results['first_ff_age']
 
 # Display Results
 st.header("📊 Results Overview")
@@ -124,31 +85,41 @@ else:
     st.warning("Based on your current inputs, financial freedom is not achieved before life expectancy.")
 
 # Plotting
+# Altair charts are sent to the browser as Vega-Lite specs and rendered client-side
+dollar_axis = alt.Axis(format='$,.0f')
+
 st.subheader("Net Worth Over Time")
-fig1, ax1 = plt.subplots()
-ax1.plot(df['Age'], df['Net Worth'], label='Net Worth', color='green')
-ax1.fill_between(df['Age'], 0, df['Net Worth'], color='green', alpha=0.1)
-ax1.set_xlabel('Age')
-ax1.set_ylabel('Net Worth ($)')
-ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, pos: f'${int(x):,}'))
-st.pyplot(fig1)
+net_worth_chart = alt.Chart(df[['Age', 'Net Worth']]).encode(
+    x=alt.X('Age:Q'),
+    y=alt.Y('Net Worth:Q', title='Net Worth ($)', axis=dollar_axis),
+)
+st.altair_chart(
+    net_worth_chart.mark_area(color='green', opacity=0.1) + net_worth_chart.mark_line(color='green')
+)
 
 st.subheader("Income and Expenses Over Time")
-fig2, ax2 = plt.subplots()
-ax2.plot(df['Age'], df['Salary'], label='Salary', color='blue')
-ax2.plot(df['Age'], df['Spending'], label='Spending', color='orange')
-ax2.plot(df['Age'], df['Investment Income'], label='Investment Income', color='green')
+income_series = ['Salary', 'Spending', 'Investment Income']
+income_long = df.melt(id_vars='Age', value_vars=income_series, var_name='Series', value_name='Amount')
+income_chart = alt.Chart(income_long).mark_line().encode(
+    x=alt.X('Age:Q'),
+    y=alt.Y('Amount:Q', title='Amount ($)', axis=dollar_axis),
+    color=alt.Color('Series:N', title=None, sort=income_series,
+                    scale=alt.Scale(domain=income_series, range=['blue', 'orange', 'green'])),
+)
 if first_ff_age:
-    ax2.axvline(x=first_ff_age, color='red', linestyle='--', label='Financial Freedom Age')
-ax2.set_xlabel('Age')
-ax2.set_ylabel('Amount ($)')
-ax2.yaxis.set_major_formatter(FuncFormatter(lambda x, pos: f'${int(x):,}'))
-ax2.legend()
-st.pyplot(fig2)
+    freedom_rule = alt.Chart(pd.DataFrame({'Age': [first_ff_age]})).mark_rule(
+        color='red', strokeDash=[6, 4]
+    ).encode(x='Age:Q', tooltip=alt.Tooltip('Age:Q', title='Financial Freedom Age'))
+    income_chart = income_chart + freedom_rule
+st.altair_chart(income_chart)
 
 # Detailed Data Table
 st.subheader("Detailed Financial Projections")
-st.dataframe(df[['Age', 'Salary', 'After-Tax Income', 'Spending', 'Retirement Contribution', 'Net Worth', 'Investment Income']].style.format('${:,.0f}'))
+table_columns = ['Salary', 'After-Tax Income', 'Spending', 'Retirement Contribution', 'Net Worth', 'Investment Income']
+st.dataframe(
+    df[['Age'] + table_columns],
+    column_config={column: st.column_config.NumberColumn(format='$%,.0f') for column in table_columns},
+)
 
 # Additional Insights
 st.header("📈 Additional Insights")
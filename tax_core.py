@@ -0,0 +1,83 @@
+import numpy as np
+from numba import njit
+
+# Tax configuration constants
+TAX_BRACKETS = {
+    'income': [(0, 11000), (11001, 44725), (44726, 95375), (95376, 182100), (182101, 231250), (231251, 578125), (578126, float('inf'))],
+    'fica': [(0, 160000)],
+    'capital_gains': [(0, 40000), (40001, 441450), (441451, float('inf'))]
+}
+
+TAX_RATES = {
+    'income': [0.10, 0.12, 0.22, 0.24, 0.32, 0.35, 0.37],
+    'fica': [0.0765],
+    'capital_gains': [0.0, 0.15, 0.20]
+}
+
+DEDUCTIONS = {
+    'income': 13850,
+    'fica': 0,
+    'capital_gains': 0
+}
+
+def _jit_brackets(tax_type):
+    lows = np.array([low for low, _ in TAX_BRACKETS[tax_type]], dtype=np.float64)
+    highs = np.array([high for _, high in TAX_BRACKETS[tax_type]], dtype=np.float64)
+    rates = np.array(TAX_RATES[tax_type], dtype=np.float64)
+    # fastmath assumes no infinities, so cap the open-ended top bracket
+    return lows, np.minimum(highs, np.finfo(np.float64).max), rates
+
+_INCOME_DEDUCTION = float(DEDUCTIONS['income'])
+_INCOME_LOWS, _INCOME_HIGHS, _INCOME_RATES = _jit_brackets('income')
+_FICA_DEDUCTION = float(DEDUCTIONS['fica'])
+_FICA_LOWS, _FICA_HIGHS, _FICA_RATES = _jit_brackets('fica')
+
+@njit(cache=True, fastmath=True)
+def _bracket_tax(income, deduction, lows, highs, rates):
+    taxable_income = max(income - deduction, 0.0)
+    tax = 0.0
+    for i in range(lows.size):
+        tax += max(min(taxable_income, highs[i]) - lows[i], 0.0) * rates[i]
+    return tax
+
+@njit(cache=True, fastmath=True)
+def project(age, life_expectancy, initial_salary, salary_growth, diminish_growth,
+            savings_rate, current_savings, rate_of_return, rate_on_debt,
+            withdrawal_rate, other_income):
+    career_length = life_expectancy - age
+    salary = np.empty(career_length)
+    income_taxes = np.empty(career_length)
+    fica_taxes = np.empty(career_length)
+    total_tax = np.empty(career_length)
+    after_tax_income = np.empty(career_length)
+    contributions = np.empty(career_length)
+    net_worth = np.empty(career_length)
+    spending = np.empty(career_length)
+    investment_income = np.empty(career_length)
+
+    balance = current_savings
+    for i in range(career_length):
+        if diminish_growth:
+            salary[i] = initial_salary * (1.0 + salary_growth * (1.0 - i / career_length))
+        else:
+            salary[i] = initial_salary * (1.0 + salary_growth) ** i
+
+        income_taxes[i] = _bracket_tax(salary[i], _INCOME_DEDUCTION, _INCOME_LOWS, _INCOME_HIGHS, _INCOME_RATES)
+        fica_taxes[i] = _bracket_tax(salary[i], _FICA_DEDUCTION, _FICA_LOWS, _FICA_HIGHS, _FICA_RATES)
+        total_tax[i] = income_taxes[i] + fica_taxes[i]
+        after_tax_income[i] = salary[i] - total_tax[i]
+        contributions[i] = after_tax_income[i] * savings_rate
+        spending[i] = after_tax_income[i] - contributions[i]
+
+        if i > 0:
+            growth_rate = rate_of_return if balance >= 0 else rate_on_debt
+            balance = balance * (1 + growth_rate)
+        balance += contributions[i]
+        net_worth[i] = balance
+        investment_income[i] = balance * withdrawal_rate + other_income
+
+    return (salary, income_taxes, fica_taxes, total_tax, after_tax_income,
+            contributions, net_worth, spending, investment_income)
+
+# Compile once at import so the first rerun doesn't pay the JIT cost
+project(30, 32, 0.0, 0.0, False, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)